@@ -0,0 +1,47 @@
+/* Пакетные формулы показателей тренировок.
+ *
+ * Сборка (авто-векторизация включается флагами оптимизации):
+ *     cc -O3 -march=native -ffast-math -shared -fPIC calories.c \
+ *         -o libcalories.so
+ */
+#include <stddef.h>
+
+void running_bulk(const double *action, const double *duration,
+                  const double *weight, double *distance, double *speed,
+                  double *calories, size_t n)
+{
+    for (size_t i = 0; i < n; i++) {
+        distance[i] = action[i] * (0.65 / 1000.0);
+        speed[i] = distance[i] / duration[i];
+        calories[i] = (18.0 * speed[i] + 1.79) * weight[i] * 0.06
+                      * duration[i];
+    }
+}
+
+void walking_bulk(const double *action, const double *duration,
+                  const double *weight, const double *height,
+                  double *distance, double *speed, double *calories,
+                  size_t n)
+{
+    for (size_t i = 0; i < n; i++) {
+        distance[i] = action[i] * (0.65 / 1000.0);
+        speed[i] = distance[i] / duration[i];
+        double msec = speed[i] * 0.278;
+        calories[i] = (0.035 * weight[i]
+                       + msec * msec / (height[i] / 100.0) * 0.029
+                         * weight[i])
+                      * duration[i] * 60.0;
+    }
+}
+
+void swimming_bulk(const double *action, const double *duration,
+                   const double *weight, const double *length_pool,
+                   const double *count_pool, double *distance,
+                   double *speed, double *calories, size_t n)
+{
+    for (size_t i = 0; i < n; i++) {
+        distance[i] = action[i] * (1.38 / 1000.0);
+        speed[i] = length_pool[i] * count_pool[i] / 1000.0 / duration[i];
+        calories[i] = (speed[i] + 1.1) * 2.0 * weight[i] * duration[i];
+    }
+}
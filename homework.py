@@ -1,21 +1,83 @@
-import csv
-from dataclasses import dataclass
-from typing import List
+from __future__ import annotations
+
+import ctypes
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import cython
+except ImportError:
+    _CYTHON_COMPILED = False
+else:
+    _CYTHON_COMPILED = cython.compiled
+
+if _CYTHON_COMPILED:
+    _USE_NUMBA = False
+else:
+    _USE_NUMBA = find_spec('numba') is not None
+
+if _USE_NUMBA:
+    from numba import float64, njit, prange
+else:
+    # Скомпилированному Cython-модулю JIT не нужен, а на PyPy numba
+    # недоступна и её роль берёт на себя трассирующий JIT интерпретатора:
+    # в обоих случаях формулы выполняются как есть.
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+    def float64(*args):
+        return None
+
+    prange = range
 
 
 class InvalidInputDataError(Exception):
     """Исключение, возникающее из-за ошибок в полученных данных от датчиков."""
 
 
-@dataclass
+_FMT = (
+    'Тип тренировки: {}; '
+    'Длительность: {:.3f} ч.; '
+    'Дистанция: {:.3f} км; '
+    'Ср. скорость: {:.3f} км/ч; '
+    'Потрачено ккал: {:.3f}.'
+)
+
+
 class InfoMessage:
-    """Информационное сообщение о тренировке."""
+    """Информационное сообщение о тренировке.
+
+    Args:
+        training_type (str): Название типа тренировки.
+        duration (float): Длительность тренировки в часах.
+        distance (float): Пройденная дистанция в км.
+        speed (float): Средняя скорость во время тренировки в км/ч.
+        calories (float): Количество затраченных калорий.
+    """
+
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
+    def __init__(
+        self,
+        training_type: str,
+        duration: float,
+        distance: float,
+        speed: float,
+        calories: float,
+    ) -> None:
+        self.training_type = training_type
+        self.duration = duration
+        self.distance = distance
+        self.speed = speed
+        self.calories = calories
 
     def get_message(self) -> str:
         """Формирует информацию о тренировке.
@@ -25,14 +87,163 @@ class InfoMessage:
             длительность тренировки в часах, дистанция в км., среднюю скорость
             во время тренировки в км/ч и количество затраченных калорий.
         """
-        return (
-            f'Тип тренировки: {self.training_type}; '
-            f'Длительность: {self.duration:.3f} ч.; '
-            f'Дистанция: {self.distance:.3f} км.; '
-            f'Ср. скорость: {self.speed:.3f} км/ч; '
-            f'Потрачено ккал: {self.calories:.3f}.'
+        return _FMT.format(
+            self.training_type,
+            self.duration,
+            self.distance,
+            self.speed,
+            self.calories,
         )
 
+    @staticmethod
+    def format_many(
+        training_types: Iterable[str],
+        durations: Iterable[float],
+        distances: Iterable[float],
+        speeds: Iterable[float],
+        calories: Iterable[float],
+    ) -> List[str]:
+        """Формирует сообщения сразу для пакета тренировок.
+
+        Args:
+            training_types (Iterable[str]): Названия типов тренировок.
+            durations (Iterable[float]): Длительности тренировок в часах.
+            distances (Iterable[float]): Дистанции в км.
+            speeds (Iterable[float]): Средние скорости в км/ч.
+            calories (Iterable[float]): Количества затраченных калорий.
+
+        Returns:
+            Список строк с информацией о каждой тренировке.
+        """
+        fmt = _FMT.format
+        return [
+            fmt(*values)
+            for values in zip(
+                training_types,
+                durations,
+                distances,
+                speeds,
+                calories,
+            )
+        ]
+
+
+@njit(float64(float64, float64, float64), cache=True, fastmath=True)
+def _run_cal(speed, duration, weight):
+    """Скомпилированная формула затраченных калорий для бега."""
+    return (18.0 * speed + 1.79) * weight * 0.06 * duration
+
+
+@njit(float64(float64, float64, float64, float64), cache=True, fastmath=True)
+def _walk_cal(speed, duration, weight, height):
+    """Скомпилированная формула затраченных калорий для ходьбы."""
+    return (
+        0.035 * weight
+        + (speed * 0.278) ** 2 / (height / 100.0) * 0.029 * weight
+    ) * duration * 60.0
+
+
+@njit(float64(float64, float64, float64), cache=True, fastmath=True)
+def _swim_cal(speed, duration, weight):
+    """Скомпилированная формула затраченных калорий для плавания."""
+    return (speed + 1.1) * 2.0 * weight * duration
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def bulk_running(action, duration, weight, distance, speed, calories):
+    """Заполняет показатели пакета пробежек параллельно по строкам."""
+    for i in prange(action.shape[0]):
+        distance[i] = action[i] * (0.65 / 1000.0)
+        speed[i] = distance[i] / duration[i]
+        calories[i] = (18.0 * speed[i] + 1.79) * weight[i] * 0.06 * duration[i]
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def bulk_walking(action, duration, weight, height, distance, speed, calories):
+    """Заполняет показатели пакета ходьбы параллельно по строкам."""
+    for i in prange(action.shape[0]):
+        distance[i] = action[i] * (0.65 / 1000.0)
+        speed[i] = distance[i] / duration[i]
+        calories[i] = (
+            0.035 * weight[i]
+            + (speed[i] * 0.278) ** 2 / (height[i] / 100.0) * 0.029 * weight[i]
+        ) * duration[i] * 60.0
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def bulk_swimming(
+    action,
+    duration,
+    weight,
+    length_pool,
+    count_pool,
+    distance,
+    speed,
+    calories,
+):
+    """Заполняет показатели пакета заплывов параллельно по строкам."""
+    for i in prange(action.shape[0]):
+        distance[i] = action[i] * (1.38 / 1000.0)
+        speed[i] = length_pool[i] * count_pool[i] / 1000.0 / duration[i]
+        calories[i] = (speed[i] + 1.1) * 2.0 * weight[i] * duration[i]
+
+
+def _load_calories_lib():
+    """Подключает заранее собранную C-библиотеку пакетных формул.
+
+    Библиотека libcalories.so собирается один раз из calories.c и в
+    отличие от JIT не требует прогрева при каждом запуске. Если файла
+    рядом с модулем нет, пакетные формулы считает numba или NumPy.
+
+    Returns:
+        Объект библиотеки с настроенными сигнатурами или None.
+    """
+    path = Path(__file__).with_name('libcalories.so')
+    if not path.exists():
+        return None
+    lib = ctypes.CDLL(str(path))
+    array = np.ctypeslib.ndpointer(np.float64, flags='C_CONTIGUOUS')
+    for name, fields in (
+        ('running_bulk', 3),
+        ('walking_bulk', 4),
+        ('swimming_bulk', 5),
+    ):
+        kernel = getattr(lib, name)
+        kernel.argtypes = [array] * (fields + 3) + [ctypes.c_size_t]
+        kernel.restype = None
+    return lib
+
+
+_CALORIES_LIB = _load_calories_lib()
+
+
+def _make_formatter(training_type: str) -> staticmethod:
+    """Собирает форматер сообщения с именем типа, зашитым в код.
+
+    Имя типа тренировки подставляется в исходный текст функции на
+    этапе объявления класса, поэтому готовая f-строка хранит его в
+    константах кода и не форматирует заново для каждой тренировки.
+
+    Args:
+        training_type (str): Название типа тренировки.
+
+    Returns:
+        Статический метод, форматирующий сообщение о тренировке.
+    """
+    src = (
+        'def _format_message(duration, distance, speed, calories):\n'
+        '    return (\n'
+        f"        f'Тип тренировки: {training_type}; '\n"
+        "        f'Длительность: {duration:.3f} ч.; '\n"
+        "        f'Дистанция: {distance:.3f} км; '\n"
+        "        f'Ср. скорость: {speed:.3f} км/ч; '\n"
+        "        f'Потрачено ккал: {calories:.3f}.'\n"
+        '    )\n'
+    )
+    namespace = {}
+    exec(src, namespace)
+    return staticmethod(namespace['_format_message'])
+
 
 class Training:
     """Базовый класс тренировки.
@@ -43,9 +254,25 @@ class Training:
         weight (float): Вес спортсмена в кг.
     """
 
+    __slots__ = ('action', 'duration', 'weight', '_distance', '_speed')
+
     LEN_STEP = 0.65
     M_IN_KM = 1000
     MIN_IN_H = 60
+    TRAINING_TYPE = 'Training'
+
+    _format_message = _make_formatter(TRAINING_TYPE)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Кеширует имя наследника в константе при объявлении класса.
+
+        Благодаря этому при формировании сообщения не нужно заново
+        обращаться к type(self).__name__ для каждой тренировки, а
+        специализированный форматер хранит имя прямо в своём коде.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.TRAINING_TYPE = cls.__name__
+        cls._format_message = _make_formatter(cls.__name__)
 
     def __init__(
         self,
@@ -56,22 +283,57 @@ class Training:
         self.action = action
         self.duration = duration
         self.weight = weight
+        self._distance = None
+        self._speed = None
 
-    def get_distance(self) -> float:
+    def get_distance(self, _m_in_km: int = M_IN_KM) -> float:
         """Формирует пройденную дистанцию в км.
 
+        Значение считается при первом вызове и кешируется в слоте:
+        показатели тренировки после создания объекта не меняются.
+        Константа класса привязана аргументом по умолчанию, чтобы
+        обращение к ней стоило как чтение локальной переменной.
+
         Returns:
             Значение дистанции в км.
         """
-        return self.action * self.LEN_STEP / Training.M_IN_KM
+        if self._distance is None:
+            self._distance = self.action * self.LEN_STEP / _m_in_km
+        return self._distance
+
+    def _mean_speed_from(self, distance: float) -> float:
+        """Формирует среднюю скорость по уже подсчитанной дистанции.
+
+        Args:
+            distance (float): Пройденная дистанция в км.
+
+        Returns:
+            Значение средней скорости во время тренировки в км/ч.
+        """
+        return distance / self.duration
 
     def get_mean_speed(self) -> float:
         """Формирует среднюю скорость движения.
 
+        Значение считается при первом вызове и кешируется в слоте.
+
         Returns:
             Значение средней скорости во время тренировки в км/ч.
         """
-        return self.get_distance() / self.duration
+        if self._speed is None:
+            self._speed = self._mean_speed_from(self.get_distance())
+        return self._speed
+
+    def _calories_from(self, speed: float) -> float:
+        """Формирует количество калорий по уже подсчитанной скорости.
+
+        Args:
+            speed (float): Средняя скорость во время тренировки в км/ч.
+
+        Returns:
+            Значение количества затраченных калорий во время тренировки.
+        """
+        return self.get_spent_calories()
 
     def get_spent_calories(self) -> float:
         """Формирует количество затраченных калорий.
@@ -87,15 +349,38 @@ class Training:
     def show_training_info(self) -> InfoMessage:
         """Передаёт данные в класс InfoMessage для формирования сообщения.
 
+        Дистанция и скорость считаются по одному разу, а не заново
+        в каждом методе.
+
         Returns:
             Объект класса сообщения.
         """
+        distance = self.get_distance()
+        speed = self.get_mean_speed()
         return InfoMessage(
-            type(self).__name__,
+            self.TRAINING_TYPE,
             self.duration,
-            self.get_distance(),
-            self.get_mean_speed(),
-            self.get_spent_calories(),
+            distance,
+            speed,
+            self._calories_from(speed),
+        )
+
+    def report(self) -> str:
+        """Формирует сообщение о тренировке без промежуточного объекта.
+
+        В отличие от show_training_info() строка собирается напрямую
+        специализированным форматером класса, без создания InfoMessage.
+
+        Returns:
+            Строку с информацией о тренировке и её показателях.
+        """
+        distance = self.get_distance()
+        speed = self.get_mean_speed()
+        return self._format_message(
+            self.duration,
+            distance,
+            speed,
+            self._calories_from(speed),
         )
 
 
@@ -108,8 +393,24 @@ class Running(Training):
         weight (float): Вес спортсмена в кг.
     """
 
+    __slots__ = ()
+
     CALORIES_MEAN_SPEED_MULTIPLIER = 18
     CALORIES_MEAN_SPEED_SHIFT = 1.79
+    # Свёрнутое в одну константу выражение / M_IN_KM * MIN_IN_H: умножение
+    # на 0.06 заменяет деление и лишнее чтение констант класса.
+    _MIN_PER_KM = Training.MIN_IN_H / Training.M_IN_KM
+
+    def _calories_from(self, speed: float) -> float:
+        """Формирует количество калорий по уже подсчитанной скорости.
+
+        Args:
+            speed (float): Средняя скорость во время тренировки в км/ч.
+
+        Returns:
+            Значение количества затраченных калорий во время тренировки.
+        """
+        return _run_cal(speed, self.duration, self.weight)
 
     def get_spent_calories(self) -> float:
         """Формирует количество затраченных калорий.
@@ -118,16 +419,7 @@ class Running(Training):
             Значение количества затраченных калорий во время
             тренировки.
         """
-        return (
-            (
-                self.CALORIES_MEAN_SPEED_MULTIPLIER * self.get_mean_speed()
-                + self.CALORIES_MEAN_SPEED_SHIFT
-            )
-            * self.weight
-            / Training.M_IN_KM
-            * self.duration
-            * Training.MIN_IN_H
-        )
+        return self._calories_from(self.get_mean_speed())
 
 
 class SportsWalking(Training):
@@ -140,6 +432,8 @@ class SportsWalking(Training):
         height (float): Рост спортсмена в см.
     """
 
+    __slots__ = ('height',)
+
     CALORIES_WEIGHT_MULTIPLIER = 0.035
     CALORIES_SPEED_HEIGHT_MULTIPLIER = 0.029
     KMH_IN_MSEC = 0.278  # коэффициент для перевода км/ч в м/с
@@ -159,6 +453,17 @@ class SportsWalking(Training):
         )
         self.height = height
 
+    def _calories_from(self, speed: float) -> float:
+        """Формирует количество калорий по уже подсчитанной скорости.
+
+        Args:
+            speed (float): Средняя скорость во время тренировки в км/ч.
+
+        Returns:
+            Значение количества затраченных калорий во время тренировки.
+        """
+        return _walk_cal(speed, self.duration, self.weight, self.height)
+
     def get_spent_calories(self) -> float:
         """Формирует количество затраченных калорий.
 
@@ -166,19 +471,7 @@ class SportsWalking(Training):
             Значение количества затраченных калорий во время
             тренировки.
         """
-        return (
-            (
-                self.CALORIES_WEIGHT_MULTIPLIER * self.weight
-                + (
-                    (self.get_mean_speed() * self.KMH_IN_MSEC) ** 2
-                    / (self.height / self.CM_IN_M)
-                )
-                * self.CALORIES_SPEED_HEIGHT_MULTIPLIER
-                * self.weight
-            )
-            * self.duration
-            * Training.MIN_IN_H
-        )
+        return self._calories_from(self.get_mean_speed())
 
 
 class Swimming(Training):
@@ -192,6 +485,8 @@ class Swimming(Training):
         count_pool (float):  Сколько раз пользователь переплыл бассейн.
     """
 
+    __slots__ = ('length_pool', 'count_pool')
+
     LEN_STEP = 1.38
     CALORIES_MEAN_SPEED_SHIFT = 1.1
     CALORIES_MULTIPLIER = 2
@@ -212,8 +507,18 @@ class Swimming(Training):
         self.length_pool = length_pool
         self.count_pool = count_pool
 
-    def get_mean_speed(self) -> float:
-        """Формирует среднюю скорость движения.
+    def _mean_speed_from(
+        self,
+        distance: float,
+        _m_in_km: int = Training.M_IN_KM,
+    ) -> float:
+        """Формирует среднюю скорость по показателям бассейна.
+
+        Дистанция в аргументе не участвует в формуле: скорость в воде
+        считается по длине бассейна и количеству заплывов.
+
+        Args:
+            distance (float): Пройденная дистанция в км.
 
         Returns:
             Значение средней скорости во время тренировки в км/ч.
@@ -221,10 +526,21 @@ class Swimming(Training):
         return (
             self.length_pool
             * self.count_pool
-            / Training.M_IN_KM
+            / _m_in_km
             / self.duration
         )
 
+    def _calories_from(self, speed: float) -> float:
+        """Формирует количество калорий по уже подсчитанной скорости.
+
+        Args:
+            speed (float): Средняя скорость во время тренировки в км/ч.
+
+        Returns:
+            Значение количества затраченных калорий во время тренировки.
+        """
+        return _swim_cal(speed, self.duration, self.weight)
+
     def get_spent_calories(self) -> float:
         """Формирует количество затраченных калорий.
 
@@ -232,12 +548,238 @@ class Swimming(Training):
             Значение количества затраченных калорий во время
             тренировки.
         """
-        return (
-            (self.get_mean_speed() + self.CALORIES_MEAN_SPEED_SHIFT)
-            * self.CALORIES_MULTIPLIER
-            * self.weight
-            * self.duration
+        return self._calories_from(self.get_mean_speed())
+
+
+def running_calories(
+    speed: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+) -> np.ndarray:
+    """Формирует количество затраченных калорий для пакета пробежек.
+
+    Args:
+        speed (np.ndarray): Средние скорости в км/ч.
+        duration (np.ndarray): Длительность тренировок в часах.
+        weight (np.ndarray): Вес спортсменов в кг.
+
+    Returns:
+        Массив значений количества затраченных калорий.
+    """
+    return (
+        (
+            Running.CALORIES_MEAN_SPEED_MULTIPLIER * speed
+            + Running.CALORIES_MEAN_SPEED_SHIFT
+        )
+        * weight
+        * Running._MIN_PER_KM
+        * duration
+    )
+
+
+def walking_calories(
+    speed: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    height: np.ndarray,
+) -> np.ndarray:
+    """Формирует количество затраченных калорий для пакета ходьбы.
+
+    Args:
+        speed (np.ndarray): Средние скорости в км/ч.
+        duration (np.ndarray): Длительность тренировок в часах.
+        weight (np.ndarray): Вес спортсменов в кг.
+        height (np.ndarray): Рост спортсменов в см.
+
+    Returns:
+        Массив значений количества затраченных калорий.
+    """
+    return (
+        (
+            SportsWalking.CALORIES_WEIGHT_MULTIPLIER * weight
+            + (speed * SportsWalking.KMH_IN_MSEC) ** 2
+            / (height / SportsWalking.CM_IN_M)
+            * SportsWalking.CALORIES_SPEED_HEIGHT_MULTIPLIER
+            * weight
         )
+        * duration
+        * Training.MIN_IN_H
+    )
+
+
+def swimming_calories(
+    speed: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+) -> np.ndarray:
+    """Формирует количество затраченных калорий для пакета заплывов.
+
+    Args:
+        speed (np.ndarray): Средние скорости в км/ч.
+        duration (np.ndarray): Длительность тренировок в часах.
+        weight (np.ndarray): Вес спортсменов в кг.
+
+    Returns:
+        Массив значений количества затраченных калорий.
+    """
+    return (
+        (speed + Swimming.CALORIES_MEAN_SPEED_SHIFT)
+        * Swimming.CALORIES_MULTIPLIER
+        * weight
+        * duration
+    )
+
+
+def _vector_running(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели пробежек ufunc-выражениями без numba и C.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    distance = action * (Running.LEN_STEP / Training.M_IN_KM)
+    speed = distance / duration
+    return distance, speed, running_calories(speed, duration, weight)
+
+
+def _vector_walking(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    height: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели ходьбы ufunc-выражениями без numba и C.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    distance = action * (SportsWalking.LEN_STEP / Training.M_IN_KM)
+    speed = distance / duration
+    return distance, speed, walking_calories(speed, duration, weight, height)
+
+
+def _vector_swimming(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    length_pool: np.ndarray,
+    count_pool: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели заплывов ufunc-выражениями без numba и C.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    distance = action * (Swimming.LEN_STEP / Training.M_IN_KM)
+    speed = length_pool * count_pool / Training.M_IN_KM / duration
+    return distance, speed, swimming_calories(speed, duration, weight)
+
+
+def _compute_bulk(
+    c_name: str,
+    numba_kernel,
+    vector_kernel,
+    fields: int,
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели пакета наиболее быстрым доступным ядром.
+
+    Предпочитает ядро из C-библиотеки, когда она собрана, затем
+    параллельное numba-ядро; без того и другого расчёт выполняют
+    векторные ufunc-выражения NumPy, а не поэлементный цикл
+    интерпретатора.
+
+    Args:
+        c_name (str): Имя функции в C-библиотеке.
+        numba_kernel: Пакетное ядро, скомпилированное numba.
+        vector_kernel: Запасной векторный расчёт на ufunc NumPy.
+        fields (int): Количество показателей у данного типа тренировки.
+        values (np.ndarray): Показатели датчиков, по строке на тренировку.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    columns = [np.ascontiguousarray(values[:, i]) for i in range(fields)]
+    if _CALORIES_LIB is None and not _USE_NUMBA:
+        return vector_kernel(*columns)
+    size = values.shape[0]
+    distance = np.empty(size)
+    speed = np.empty(size)
+    calories = np.empty(size)
+    if _CALORIES_LIB is not None:
+        getattr(_CALORIES_LIB, c_name)(
+            *columns,
+            distance,
+            speed,
+            calories,
+            size,
+        )
+    else:
+        numba_kernel(*columns, distance, speed, calories)
+    return distance, speed, calories
+
+
+def compute_running(
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели пакета пробежек одним плотным проходом.
+
+    Args:
+        values (np.ndarray): Показатели датчиков, по строке на пробежку.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    return _compute_bulk(
+        'running_bulk',
+        bulk_running,
+        _vector_running,
+        3,
+        values,
+    )
+
+
+def compute_walking(
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели пакета ходьбы одним плотным проходом.
+
+    Args:
+        values (np.ndarray): Показатели датчиков, по строке на прогулку.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    return _compute_bulk(
+        'walking_bulk',
+        bulk_walking,
+        _vector_walking,
+        4,
+        values,
+    )
+
+
+def compute_swimming(
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Считает показатели пакета заплывов одним плотным проходом.
+
+    Args:
+        values (np.ndarray): Показатели датчиков, по строке на заплыв.
+
+    Returns:
+        Кортеж массивов дистанций, средних скоростей и калорий.
+    """
+    return _compute_bulk(
+        'swimming_bulk',
+        bulk_swimming,
+        _vector_swimming,
+        5,
+        values,
+    )
 
 
 WORKOUT_CODES = {
@@ -246,14 +788,22 @@ WORKOUT_CODES = {
     'SWM': Swimming,
 }
 
+WORKOUT_FIELDS = {
+    'RUN': 3,
+    'WLK': 4,
+    'SWM': 5,
+}
+
 
-def read_package(workout_type: str, data: List[float]) -> Training:
+def read_package(workout_type: str, data: Sequence[float]) -> Training:
     """Считывает данные полученные от датчиков.
 
     Args:
         workout_type (str): Кодовое обозначение прошедшей тренировки.
-        data (List[float]): Список показателей, полученных от датчиков
-            устройства.
+        data (Sequence[float]): Показатели, полученные от датчиков
+            устройства: подойдёт и список, и непрерывный буфер
+            вещественных чисел вроде array.array('d') или строки
+            массива NumPy.
 
     Returns:
         Объект соответствующего класса, передав ему на вход
@@ -263,10 +813,10 @@ def read_package(workout_type: str, data: List[float]) -> Training:
         InvalidInputDataError: Если имеются ошибки в кодовом обозначении
             прошедшей тренировки или списке показателей.
     """
-    try:
-        return WORKOUT_CODES[workout_type](*data)
-    except (KeyError, TypeError) as err:
-        raise InvalidInputDataError(err)
+    training = WORKOUT_CODES.get(workout_type)
+    if training is None or len(data) != WORKOUT_FIELDS[workout_type]:
+        raise InvalidInputDataError(f'{workout_type} {list(data)}')
+    return training(*data)
 
 
 def main(training: Training) -> None:
@@ -278,20 +828,98 @@ def main(training: Training) -> None:
     Returns:
         Информацию на экран о тренировке и её показателях.
     """
-    print(training.show_training_info().get_message())
+    sys.stdout.write(training.report() + '\n')
+
+
+BATCH_COMPUTE = {
+    'RUN': compute_running,
+    'WLK': compute_walking,
+    'SWM': compute_swimming,
+}
+
+
+def batch_messages(workout_type: str, values: np.ndarray) -> List[str]:
+    """Формирует сообщения для пакета тренировок одного типа.
+
+    Args:
+        workout_type (str): Кодовое обозначение прошедших тренировок.
+        values (np.ndarray): Показатели, полученные от датчиков устройств,
+            по одной строке на тренировку.
+
+    Returns:
+        Список строк с информацией о каждой тренировке.
+    """
+    distance, speed, calories = BATCH_COMPUTE[workout_type](values)
+    fmt = WORKOUT_CODES[workout_type]._format_message
+    return [
+        fmt(*row)
+        for row in zip(values[:, 1], distance, speed, calories)
+    ]
+
+
+def load_packages(filename: str) -> pd.DataFrame:
+    """Считывает файл с пакетами тренировок в таблицу.
+
+    Строки разбиваются на ячейки векторно, и состав каждой строки
+    фиксируется до приведения типов: ячейка, которая присутствует в
+    файле, но не приводится к float64 (мусор или пустое значение),
+    как и лишние поля сверх ожидаемых шести, помечают строку флагом
+    `corrupt`. Поля, отсутствующие в коротких строках, остаются NaN
+    и отсеиваются проверкой состава строки при обработке.
+
+    Args:
+        filename (str): Имя CSV-файла с пакетами тренировок.
+
+    Returns:
+        Таблицу с колонкой кода тренировки, числовыми показателями
+        и флагом некорректной строки `corrupt`.
+    """
+    lines = pd.read_csv(
+        filename,
+        header=None,
+        names=['line'],
+        dtype=str,
+        sep='\x1f',
+    )
+    cells = lines['line'].str.split(',', expand=True)
+    numeric_columns = ['action', 'duration', 'weight', 'p1', 'p2']
+    width = 1 + len(numeric_columns)
+    corrupt = cells.iloc[:, width:].notna().any(axis=1)
+    cells = cells.reindex(columns=range(width))
+    cells.columns = ['code'] + numeric_columns
+    table = pd.DataFrame({'code': cells['code']})
+    for column in numeric_columns:
+        table[column] = pd.to_numeric(cells[column], errors='coerce')
+        corrupt |= cells[column].notna() & table[column].isna()
+    table['corrupt'] = corrupt
+    return table
 
 
 if __name__ == '__main__':
-    with open('packages.csv') as reader:
-        packages = csv.reader(reader, delimiter=',')
-        for row in packages:
-            workout_type, *data = row
-            try:
-                main(
-                    read_package(
-                        workout_type,
-                        [float(item) for item in data],
-                    ),
-                )
-            except (InvalidInputDataError, ValueError) as err:
-                print(f'Неправильные входные данные: {err}')
+    try:
+        packages = load_packages('packages.csv')
+    except pd.errors.ParserError as err:
+        sys.stdout.write(f'Неправильные входные данные: {err}\n')
+        sys.exit(1)
+    codes = packages['code'].to_numpy()
+    values = packages[['action', 'duration', 'weight', 'p1', 'p2']].to_numpy()
+    corrupt = packages['corrupt'].to_numpy()
+    present = ~np.isnan(values)
+    valid = np.zeros(len(packages), dtype=bool)
+    messages = np.empty(len(packages), dtype=object)
+    for workout_type, fields in WORKOUT_FIELDS.items():
+        bucket = (codes == workout_type) & ~corrupt & (
+            present == (np.arange(values.shape[1]) < fields)
+        ).all(axis=1)
+        valid |= bucket
+        if bucket.any():
+            messages[bucket] = batch_messages(
+                workout_type,
+                values[bucket][:, :fields],
+            )
+    for index in np.flatnonzero(~valid):
+        data = values[index][present[index]].tolist()
+        messages[index] = (
+            f'Неправильные входные данные: {codes[index]} {data}'
+        )
+    sys.stdout.write('\n'.join(messages.tolist()) + '\n')
@@ -0,0 +1,23 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = None
+else:
+    # annotation_typing отключено: иначе аннотация action: int
+    # превращается в приведение к C-целому и дробные показатели
+    # датчиков молча обрезаются.
+    ext_modules = cythonize(
+        ['homework.py'],
+        compiler_directives={
+            'language_level': 3,
+            'annotation_typing': False,
+        },
+    )
+
+setup(
+    name='fitness_tracker_module',
+    py_modules=['homework'],
+    ext_modules=ext_modules,
+)
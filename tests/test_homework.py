@@ -1,9 +1,12 @@
 import inspect
 import re
+import subprocess
+import sys
 import types
 
+import numpy as np
 import pytest
-from conftest import Capturing
+from conftest import BASE_DIR, Capturing
 
 try:
     import homework
@@ -221,11 +224,11 @@ def test_Training_show_training_info(monkeypatch):
         training, 'show_training_info'
     ), 'Создайте метод `show_training_info` в классе `Training`.'
 
-    def mock_get_spent_calories():
+    def mock_get_spent_calories(self):
         return 100
 
     monkeypatch.setattr(
-        training, 'get_spent_calories', mock_get_spent_calories
+        homework.Training, 'get_spent_calories', mock_get_spent_calories
     )
     result = training.show_training_info()
     assert result.__class__.__name__ == 'InfoMessage', (
@@ -466,3 +469,71 @@ def test_main_output(input_data, expected):
     assert (
         get_message_output == expected
     ), 'Метод `main` должен печатать результат в консоль.\n'
+
+
+@pytest.mark.parametrize(
+    'workout_type, data',
+    [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+    ],
+)
+def test_batch_messages(workout_type, data):
+    values = np.array([data], dtype=np.float64)
+    expected = homework.read_package(workout_type, data).report()
+    assert homework.batch_messages(workout_type, values) == [expected], (
+        'Функция `batch_messages` должна возвращать те же '
+        'сообщения, что и обработка одиночного пакета.'
+    )
+
+
+@pytest.mark.parametrize(
+    'row, corrupt',
+    [
+        ('SWM,720,1,80,25,40', False),
+        ('RUN,15000,1,75', False),
+        ('RUN,15000,1,75,5', False),
+        ('RUN,15000,1,75,garbage', True),
+        ('RUN,15000,1,75,', True),
+        ('RUN,abc,1,75', True),
+        ('SWM,720,1,80,25,40,7', True),
+    ],
+)
+def test_load_packages_corrupt_flag(tmp_path, row, corrupt):
+    filename = tmp_path / 'packages.csv'
+    filename.write_text(row + '\n')
+    packages = homework.load_packages(str(filename))
+    assert bool(packages['corrupt'][0]) == corrupt, (
+        'Функция `load_packages` должна помечать строку '
+        f'`{row}` флагом corrupt={corrupt}.'
+    )
+
+
+def test_batch_output_rejects_corrupt_rows(tmp_path):
+    filename = tmp_path / 'packages.csv'
+    filename.write_text(
+        'RUN,15000,1,75\n'
+        'RUN,15000,1,75,garbage\n'
+        'RUN,15000,1,75,\n'
+        'RUN,15000,1,75,5\n'
+    )
+    result = subprocess.run(
+        [sys.executable, str(BASE_DIR / 'homework.py')],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    output = result.stdout.splitlines()
+    assert output[0].startswith('Тип тренировки: Running'), (
+        'Пакетная обработка должна выводить сообщение '
+        'для корректной строки.'
+    )
+    assert output[1:] == [
+        'Неправильные входные данные: RUN [15000.0, 1.0, 75.0]',
+        'Неправильные входные данные: RUN [15000.0, 1.0, 75.0]',
+        'Неправильные входные данные: RUN [15000.0, 1.0, 75.0, 5.0]',
+    ], (
+        'Строки с мусорной, пустой или лишней ячейкой должны '
+        'отклоняться сообщением `Неправильные входные данные`.'
+    )